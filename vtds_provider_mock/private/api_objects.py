@@ -57,8 +57,7 @@ class VirtualBlades(VirtualBladesBase):
         self.common = common
 
     def blade_classes(self):
-        virtual_blades = self.common.get('virtual_blades', {})
-        return [name for name, _ in virtual_blades.items()]
+        return self.common.blade_classes()
 
     def blade_count(self, blade_class):
         return self.common.blade_count(blade_class)
@@ -90,10 +89,12 @@ class VirtualBlades(VirtualBladesBase):
         )
         connections = [
             BladeConnection(
-                self.common, blade_class, instance, remote_port
+                self.common, blade_class, instance, remote_port, hostname
             )
             for blade_class in blade_classes
-            for instance in range(0, self.blade_count(blade_class))
+            for instance, hostname in enumerate(
+                self.common.blade_hostnames(blade_class)
+            )
         ]
         return BladeConnectionSet(self.common, connections)
 
@@ -130,17 +131,25 @@ class BladeInterconnects(BladeInterconnectsBase):
 
         """
         self.common = common
+        # The configuration does not change once the provider layer
+        # has been constructed, so the interconnects indexed by
+        # network name are computed once, on first use, and kept
+        # here along with a tuple of their names.
+        self.interconnects = None
+        self.names = None
 
     def __interconnects_by_name(self):
         """Return a dictionary of non-pure-base-class interconnects
         indexed by 'network_name'
 
         """
+        if self.interconnects is not None:
+            return self.interconnects
         blade_interconnects = self.common.get("blade_interconnects", {})
         try:
-            return {
+            self.interconnects = {
                 interconnect['network_name']: interconnect
-                for _, interconnect in blade_interconnects.items()
+                for interconnect in blade_interconnects.values()
                 if not interconnect.get('pure_base_class', False)
             }
         except KeyError as err:
@@ -155,12 +164,15 @@ class BladeInterconnects(BladeInterconnectsBase):
                 "provider config error: 'network_name' not specified in "
                 "the following blade interconnects: %s" % str(missing_names)
             ) from err
+        self.names = tuple(self.interconnects)
+        return self.interconnects
 
     def interconnect_names(self):
-        """Get a list of blade interconnects by name
+        """Get a tuple of blade interconnects by name
 
         """
-        return self.__interconnects_by_name().keys()
+        self.__interconnects_by_name()
+        return self.names
 
     def ipv4_cidr(self, interconnect_name):
         """Return the (string) IPv4 CIDR (<IP>/<length>) for the
@@ -187,19 +199,23 @@ class BladeConnection(BladeConnectionBase):
     external connections to ports on a specific Virtual Blade.
 
     """
-    def __init__(self, common, blade_class, instance, remote_port):
-        """Constructor
+    def __init__(
+        self, common, blade_class, instance, remote_port, hostname=None
+    ):
+        """Constructor. If the caller already has the (valid) hostname
+        of the blade instance it can pass it in 'hostname' to skip
+        looking it up.
 
         """
+        if hostname is None:
+            hostname = common.blade_hostname(blade_class, instance)
         self.common = common
-        self.b_class = blade_class
-        self.instance = instance
-        self.rem_port = remote_port
-        self.hostname = self.common.blade_hostname(
-            blade_class, instance
-        )
-        self.loc_ip = "127.0.0.1"
-        self.loc_port = 12345
+        self._blade_class = blade_class
+        self._instance = instance
+        self._remote_port = remote_port
+        self._hostname = hostname
+        self._local_ip = "127.0.0.1"
+        self._local_port = 12345
 
     def __enter__(self):
         return self
@@ -214,19 +230,19 @@ class BladeConnection(BladeConnectionBase):
         pass
 
     def blade_class(self):
-        return self.b_class
+        return self._blade_class
 
     def blade_hostname(self):
-        return self.hostname
+        return self._hostname
 
     def remote_port(self):
-        return self.rem_port
+        return self._remote_port
 
     def local_ip(self):
-        return self.loc_ip
+        return self._local_ip
 
     def local_port(self):
-        return self.loc_port
+        return self._local_port
 
 
 class BladeConnectionSet(BladeConnectionSetBase):
@@ -336,12 +352,12 @@ class BladeSSHConnection(BladeSSHConnectionBase, BladeConnection):
 
         """
         jinja_values = {
-            'blade_class': self.b_class,
-            'instance': self.instance,
-            'blade_hostname': self.hostname,
-            'remote_port': self.rem_port,
-            'local_ip': self.loc_ip,
-            'local_port': self.loc_port
+            'blade_class': self._blade_class,
+            'instance': self._instance,
+            'blade_hostname': self._hostname,
+            'remote_port': self._remote_port,
+            'local_ip': self._local_ip,
+            'local_port': self._local_port
         }
         return render_command_string(cmd, jinja_values)
 
@@ -354,7 +370,7 @@ class BladeSSHConnection(BladeSSHConnectionBase, BladeConnection):
             "%scopying from '%s' to root@%s:%s "
             "[blocking=%s, logname=%s, kwargs=%s]" % (
                 "recursively " if recurse else "",
-                source, self.hostname, destination,
+                source, self._hostname, destination,
                 str(blocking), str(logname), str(kwargs)
             )
         )
@@ -368,14 +384,14 @@ class BladeSSHConnection(BladeSSHConnectionBase, BladeConnection):
             "%scopying from root@%s:%s to '%s' "
             "[blocking=%s, logname=%s, kwargs=%s]" % (
                 "recursively " if recurse else "",
-                self.hostname, source, destination,
+                self._hostname, source, destination,
                 str(blocking), str(logname), str(kwargs)
             )
         )
 
     def run_command(self, cmd, blocking=True, logfiles=None, **kwargs):
         cmd = self._render_cmd(cmd)
-        info_msg("running '%s' on '%s'" % (cmd, self.hostname))
+        info_msg("running '%s' on '%s'" % (cmd, self._hostname))
 
 
 class BladeSSHConnectionSet(BladeSSHConnectionSetBase, BladeConnectionSet):
@@ -24,6 +24,7 @@
 and so forth that relate to the GCP vTDS provider.
 
 """
+from collections.abc import Mapping
 from os.path import join as path_join
 
 from vtds_base import (
@@ -31,6 +32,67 @@ from vtds_base import (
 )
 
 
+class FrozenDict(Mapping):
+    """A read-only mapping that can be hashed (as long as its values
+    can) and so used as a dictionary key or set member. Used to hold
+    frozen configuration data.
+
+    """
+    def __init__(self, data):
+        """Constructor
+
+        """
+        self._data = dict(data)
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __hash__(self):
+        # Computing the hash walks the whole subtree, so only do it
+        # once. The contents never change, so neither does the hash.
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self):
+        return "FrozenDict(%s)" % repr(self._data)
+
+
+def deep_freeze(data):
+    """Return a read-only copy of a configuration data structure in
+    which dictionaries are replaced by FrozenDicts and lists are
+    replaced by tuples. Scalars are returned as they are.
+
+    """
+    if isinstance(data, dict):
+        return FrozenDict(
+            {key: deep_freeze(value) for key, value in data.items()}
+        )
+    if isinstance(data, list):
+        return tuple(deep_freeze(value) for value in data)
+    return data
+
+
+def deep_thaw(data):
+    """Return a plain, modifiable copy of a data structure frozen by
+    deep_freeze() with FrozenDicts turned back into dictionaries and
+    tuples turned back into lists.
+
+    """
+    if isinstance(data, Mapping):
+        return {key: deep_thaw(value) for key, value in data.items()}
+    if isinstance(data, tuple):
+        return [deep_thaw(value) for value in data]
+    return data
+
+
 class Common:
     """A class that provides common tools based on configuration and
     so forth that relate to the GCP vTDS provider.
@@ -50,16 +112,88 @@ class Common:
         """
         self.config = config
         self.build_directory = build_dir
+        # The configuration does not change once it has been handed
+        # to us, so compute the per-blade-class tables that are used
+        # by the Virtual Blade operations once here instead of
+        # digging them out of the config on every call.
+        self.virtual_blades = self.config.get('virtual_blades', {})
+        # Pure base classes are only templates for other blade
+        # classes and are never deployed, so they are left out of the
+        # tables and are looked up the slow way if anyone asks.
+        deployable_blades = {
+            blade_class: blade
+            for blade_class, blade in self.virtual_blades.items()
+            if not blade.get('pure_base_class', False)
+        }
+        self.blade_class_names = tuple(deployable_blades)
+        self.blade_counts = {
+            blade_class: self.__count(blade_class, blade)
+            for blade_class, blade in deployable_blades.items()
+        }
+        interconnect_names = {
+            blade_class: self.__interconnect_names(blade)
+            for blade_class, blade in deployable_blades.items()
+        }
+        self.blade_interconnect_names = {
+            blade_class: names
+            for blade_class, names in interconnect_names.items()
+            if names is not None
+        }
+        # Only well formed blade classes get an entry here, the rest
+        # are left to blade_hostname() to report on.
+        self.blade_hostname_lists = {
+            blade_class: tuple(
+                blade['hostnames'][:self.blade_counts[blade_class]]
+            )
+            for blade_class, blade in deployable_blades.items()
+            if isinstance(blade.get('hostnames', None), (list, tuple))
+            and 0 <= self.blade_counts[blade_class] <= len(blade['hostnames'])
+        }
+
+    @staticmethod
+    def __count(blade_class, blade):
+        """class private: return the configured instance count of a
+        blade class as an integer.
+
+        """
+        try:
+            return int(blade.get('count', 0))
+        except (TypeError, ValueError) as err:
+            raise ContextualError(
+                "provider config error: Virtual Blade class '%s' has a "
+                "'count' that is not an integer: '%s'" % (
+                    blade_class, str(blade.get('count'))
+                )
+            ) from err
+
+    @staticmethod
+    def __interconnect_names(blade):
+        """class private: return a tuple of the names of the Blade
+        Interconnects configured on a blade class or None if there
+        is no properly configured interconnect name.
+
+        """
+        blade_interconnect = blade.get('blade_interconnect', None)
+        if not isinstance(blade_interconnect, Mapping):
+            return None
+        name = blade_interconnect.get('name', None)
+        return None if name is None else (name,)
+
+    def __blade_count(self, blade_class):
+        """class private: return the instance count of the named blade
+        class, raising an error if there is no such class.
+
+        """
+        blade = self.__get_blade(blade_class)
+        count = self.blade_counts.get(blade_class, None)
+        return self.__count(blade_class, blade) if count is None else count
 
     def __get_blade(self, blade_class):
         """class private: retrieve the blade class deascription for the
         named class.
 
         """
-        virtual_blades = (
-            self.config.get('virtual_blades', {})
-        )
-        blade = virtual_blades.get(blade_class, None)
+        blade = self.virtual_blades.get(blade_class, None)
         if blade is None:
             raise ContextualError(
                 "cannot find the virtual blade class '%s'" % blade_class
@@ -91,8 +225,7 @@ class Common:
                 "Virtual Blade instance number must be integer not '%s'" %
                 str(type(instance))
             )
-        blade = self.__get_blade(blade_class)
-        count = int(blade.get('count', 0))
+        count = self.__blade_count(blade_class)
         if instance < 0 or instance >= count:
             raise ContextualError(
                 "instance number %d out of range for Virtual Blade "
@@ -101,17 +234,20 @@ class Common:
             )
 
     def get_config(self):
-        """Get the full config data stored here.
+        """Get a (plain, modifiable) copy of the full config data
+        stored here.
 
         """
-        return self.config
+        return deep_thaw(self.config)
 
     def get(self, key, default):
         """Perform a 'get' operation on the top level 'config' object
-        returning the value of 'default' if 'key' is not found.
+        returning the value of 'default' if 'key' is not found. The
+        value returned is a plain, modifiable copy of what is stored
+        in the config.
 
         """
-        return self.config.get(key, default)
+        return deep_thaw(self.config.get(key, default))
 
     def build_dir(self):
         """Return the 'build_dir' provided at creation.
@@ -126,14 +262,14 @@ class Common:
         """
         self.__check_blade_instance(blade_class, instance)
         blade = self.__get_blade(blade_class)
-        count = blade.get('count', 0)
+        count = self.__blade_count(blade_class)
         hostnames = blade.get('hostnames', None)
         if hostnames is None:
             raise ContextualError(
                 "provider config error: no 'hostnames' configured for "
                 "Virtual Blade class '%s'" % blade_class
             )
-        if not isinstance(hostnames, list):
+        if not isinstance(hostnames, (list, tuple)):
             raise ContextualError(
                 "Virtual Blade class '%s' has a 'hostnames' field that is a "
                 "'%s' not a 'list'" % (blade_class, str(type(hostnames)))
@@ -145,6 +281,21 @@ class Common:
             )
         return hostnames[instance]
 
+    def blade_hostnames(self, blade_class):
+        """Get the hostnames of all of the instances of the specified
+        class of Virtual Blade as a tuple in instance order.
+
+        """
+        hostnames = self.blade_hostname_lists.get(blade_class, None)
+        if hostnames is not None:
+            return hostnames
+        # Something is wrong with the blade class, let
+        # blade_hostname() find it and raise the appropriate error.
+        return tuple(
+            self.blade_hostname(blade_class, instance)
+            for instance in range(0, self.blade_count(blade_class))
+        )
+
     def blade_ip(self, blade_class, instance, interconnect):
         """Return the IP address (string) on the named Blade
         Interconnect of a specified instance of the named Virtual
@@ -159,7 +310,7 @@ class Common:
         if not ip_addrs:
             raise ContextualError(
                 "provider config error: Virtual Blade class '%s' has no "
-                "'ip_addrs' configured"
+                "'ip_addrs' configured" % blade_class
             )
         if instance >= len(ip_addrs):
             raise ContextualError(
@@ -169,13 +320,19 @@ class Common:
             )
         return ip_addrs[instance]
 
+    def blade_classes(self):
+        """Get the names of the Virtual Blade classes that are not
+        pure base classes as a tuple.
+
+        """
+        return self.blade_class_names
+
     def blade_count(self, blade_class):
         """Get the number of Virtual Blade instances of the specified
         class.
 
         """
-        blade = self.__get_blade(blade_class)
-        return int(blade.get('count', 0))
+        return self.__blade_count(blade_class)
 
     def blade_interconnects(self, blade_class):
         """Return the list of Blade Interconnects by name connected to
@@ -184,15 +341,17 @@ class Common:
         """
         blade = self.__get_blade(blade_class)
         # The GCP provider only lets us have one interconnect per
-        # blade class, so we are just going to go grab that and make it
-        # into a 'list' of one item.
-        name = blade.get('blade_interconnect', {}).get('name', None)
-        if name is None:
+        # blade class, so the tuple computed at construction time
+        # contains just that one name.
+        names = self.blade_interconnect_names.get(blade_class, None)
+        if names is None:
+            names = self.__interconnect_names(blade)
+        if names is None:
             raise ContextualError(
                 "provider config error: no 'blade_interconnect.name' "
                 "found in blade class '%s'" % blade_class
             )
-        return [name]
+        return names
 
     def blade_ssh_key_secret(self, blade_class):
         """Return the name of the secret used to store the SSH key
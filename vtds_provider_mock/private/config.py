@@ -24,11 +24,54 @@
 configuration.
 
 """
-from vtds_base import BaseConfiguration
+from copy import deepcopy
+from os import stat
+from os.path import join as path_join
+
+from yaml import (
+    load,
+    YAMLError
+)
+try:
+    # Prefer the libyaml backed loader when PyYAML was built with it,
+    # it is much faster than the pure python loader.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from vtds_base import (
+    ContextualError,
+    BaseConfiguration
+)
 from . import CONFIG_DIR
 
 
-# pylint: disable=too-few-public-methods
+def read_config_bytes(path, description):
+    """Read in the raw (undecoded) contents of a configuration file.
+
+    """
+    try:
+        with open(path, 'rb') as config_stream:
+            return config_stream.read()
+    except OSError as err:
+        raise ContextualError(
+            "cannot open %s '%s' - %s" % (description, path, str(err))
+        ) from err
+
+
+def parse_config(raw, path, description):
+    """Parse the raw contents of a YAML configuration file read from
+    'path' using the fastest available safe YAML loader.
+
+    """
+    try:
+        return load(raw, Loader=SafeLoader)
+    except YAMLError as err:
+        raise ContextualError(
+            "error parsing %s '%s' - %s" % (description, path, str(err))
+        ) from err
+
+
 class BaseConfig(BaseConfiguration):
     """BaseConfig class presents operations on the base configuration
     of the provider layer to callers.
@@ -39,3 +82,60 @@ class BaseConfig(BaseConfiguration):
 
         """
         super().__init__("mock provider", CONFIG_DIR)
+        # Raw and parsed configuration files indexed by path. Each
+        # entry is a tuple of '(mtime, content)' so that a file that
+        # changes on disk is read and parsed again instead of serving
+        # stale data.
+        self.raw_cache = {}
+        self.config_cache = {}
+
+    def __read(self, filename, description):
+        """class private: return the path to the named file in the
+        configuration directory along with its cached '(mtime, raw)'
+        entry, reading the file only when it has not been read before
+        or has changed since it was last read.
+
+        """
+        path = path_join(self.config_dir, filename)
+        try:
+            mtime = stat(path).st_mtime_ns
+        except OSError as err:
+            raise ContextualError(
+                "cannot open %s '%s' - %s" % (description, path, str(err))
+            ) from err
+        cached = self.raw_cache.get(path, None)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, read_config_bytes(path, description))
+            self.raw_cache[path] = cached
+        return path, cached
+
+    def __cached_config(self, filename, description):
+        """class private: return the parsed contents of the named
+        file in the configuration directory, parsing it only when it
+        has not been parsed before or has changed since it was last
+        parsed. A copy is returned so that callers are free to modify
+        the result without disturbing the cache.
+
+        """
+        description = "%s %s" % (self.description, description)
+        path, (mtime, raw) = self.__read(filename, description)
+        cached = self.config_cache.get(path, None)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, parse_config(raw, path, description))
+            self.config_cache[path] = cached
+        return deepcopy(cached[1])
+
+    def get_base_config(self):
+        return self.__cached_config(
+            self.config_file, "base configuration"
+        )
+
+    def get_test_overlay(self):
+        return self.__cached_config(
+            self.test_overlay, "test configuration overlay"
+        )
+
+    def get_base_config_text(self):
+        description = "%s base config file" % self.description
+        _, (_, raw) = self.__read(self.config_file, description)
+        return raw.decode('UTF-8')
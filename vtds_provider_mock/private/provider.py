@@ -23,6 +23,7 @@
 """Private layer implementation module for the mock provider.
 
 """
+from enum import Enum
 
 from vtds_base import (
     ContextualError,
@@ -34,7 +35,23 @@ from .api_objects import (
     Secrets
 )
 from .secret_manager import SecretManager
-from .common import Common
+from .common import (
+    Common,
+    deep_freeze
+)
+
+
+class ProviderState(Enum):
+    """The lifecycle states of the mock provider layer. A provider
+    starts out CREATED, prepare() moves it to PREPARED, deploy() to
+    DEPLOYED and remove() to REMOVED. A REMOVED provider must be
+    prepared again before it can be validated or deployed.
+
+    """
+    CREATED = 0
+    PREPARED = 1
+    DEPLOYED = 2
+    REMOVED = 3
 
 
 class Provider(ProviderAPI):
@@ -50,19 +67,100 @@ class Provider(ProviderAPI):
         """
         self.__doc__ = ProviderAPI.__doc__
         self.stack = stack
-        self.config = config.get('provider', None)
-        if self.config is None:
+        provider_config = config.get('provider', None)
+        if provider_config is None:
             raise ContextualError(
                 "no provider configuration found in top level configuration"
             )
+        # Everything below the provider layer treats the provider
+        # configuration as read-only and computes tables from it
+        # once. Take a frozen copy so that neither we nor the caller
+        # can change it out from under those tables, and so that it
+        # can be shared freely without defensive copies.
+        self.config = deep_freeze(provider_config)
         self.build_dir = build_dir
-        self.common = Common(self.config, self.build_dir)
-        self.secret_manager = SecretManager(self.config)
-        self.prepared = False
+        # The Common and SecretManager objects digest the
+        # configuration into tables when they are created. Callers
+        # that construct a provider and never use it should not pay
+        # for that, so they are created on first use (or by
+        # prepare()) instead of here.
+        self.__common = None
+        self.__secret_manager = None
+        # The API objects handed out by get_virtual_blades() and
+        # get_blade_interconnects() only wrap the (read-only)
+        # configuration, so the same ones are handed out every time
+        # until the provider is removed.
+        self.__virtual_blades = None
+        self.__blade_interconnects = None
+        # The configuration cannot change, so once it has been checked
+        # by validate() there is no need to check it again.
+        self.__config_checked = False
+        self.state = ProviderState.CREATED
+
+    @property
+    def common(self):
+        """The Common object for this provider, created on first
+        use.
+
+        """
+        if self.__common is None:
+            self.__common = Common(self.config, self.build_dir)
+        return self.__common
+
+    @property
+    def secret_manager(self):
+        """The SecretManager object for this provider, created on
+        first use.
+
+        """
+        if self.__secret_manager is None:
+            self.__secret_manager = SecretManager(self.config)
+        return self.__secret_manager
+
+    def __check_config(self):
+        """class private: check the shape of the provider
+        configuration by looking up every piece of Virtual Blade and
+        Blade Interconnect information once, so that configuration
+        errors are reported here rather than part way through some
+        later operation.
+
+        """
+        if self.__config_checked:
+            return
+        virtual_blades = self.get_virtual_blades()
+        for blade_class in virtual_blades.blade_classes():
+            interconnects = virtual_blades.blade_interconnects(blade_class)
+            virtual_blades.blade_ssh_key_secret(blade_class)
+            count = virtual_blades.blade_count(blade_class)
+            for instance in range(0, count):
+                virtual_blades.blade_hostname(blade_class, instance)
+                for interconnect in interconnects:
+                    virtual_blades.blade_ip(
+                        blade_class, instance, interconnect
+                    )
+        blade_interconnects = self.get_blade_interconnects()
+        for interconnect_name in blade_interconnects.interconnect_names():
+            blade_interconnects.ipv4_cidr(interconnect_name)
+        self.__config_checked = True
+
+    @property
+    def prepared(self):
+        """True when prepare() has been called and the provider has
+        not been removed since.
+
+        """
+        return self.state in (ProviderState.PREPARED, ProviderState.DEPLOYED)
 
     def prepare(self):
+        if self.prepared:
+            # Already prepared, nothing more to do.
+            return
         print("Preparing vtds-provider-mock")
-        self.prepared = True
+        # Digest the configuration now so that any errors in it are
+        # reported by prepare() rather than by some later operation.
+        _ = self.common
+        _ = self.secret_manager
+        self.state = ProviderState.PREPARED
 
     def validate(self):
         if not self.prepared:
@@ -71,26 +169,41 @@ class Provider(ProviderAPI):
                 "call prepare() first"
             )
         print("Validating vtds-provider-mock")
+        self.__check_config()
 
     def deploy(self):
         if not self.prepared:
             raise ContextualError(
                 "cannot deploy an unprepared provider, call prepare() first"
             )
+        if self.state == ProviderState.DEPLOYED:
+            # Already deployed, nothing more to do.
+            return
         print("Deploying vtds-provider-mock")
+        self.state = ProviderState.DEPLOYED
 
     def remove(self):
+        if self.state == ProviderState.REMOVED:
+            # Already removed, nothing more to do.
+            return
         if not self.prepared:
             raise ContextualError(
-                "cannot deploy an unprepared provider, call prepare() first"
+                "cannot remove an unprepared provider, call prepare() first"
             )
         print("Removing vtds-provider-mock")
+        self.__virtual_blades = None
+        self.__blade_interconnects = None
+        self.state = ProviderState.REMOVED
 
     def get_virtual_blades(self):
-        return VirtualBlades(self.common)
+        if self.__virtual_blades is None:
+            self.__virtual_blades = VirtualBlades(self.common)
+        return self.__virtual_blades
 
     def get_blade_interconnects(self):
-        return BladeInterconnects(self.common)
+        if self.__blade_interconnects is None:
+            self.__blade_interconnects = BladeInterconnects(self.common)
+        return self.__blade_interconnects
 
     def get_secrets(self):
         return Secrets(self.secret_manager)
@@ -41,7 +41,7 @@ class SecretManager:
         secrets = config.get('secrets', {})
         try:
             self.secrets = {
-                secret['name']: secret for _, secret in secrets.items()
+                secret['name']: secret for secret in secrets.values()
             }
         except KeyError as err:
             # No harm compiling a list since we are going to error out